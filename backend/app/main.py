@@ -3,28 +3,98 @@ FastAPI Backend for No-Code ML Pipeline Builder
 Handles dataset upload, preprocessing, train-test split, model training, and results
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
+import pyarrow as pa
+from pyarrow import feather
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LogisticRegression
-from sklearn.tree import DecisionTreeClassifier, plot_tree
+from sklearn.tree import DecisionTreeClassifier, export_graphviz, export_text
 from sklearn.metrics import accuracy_score, confusion_matrix
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import seaborn as sns
+from sklearn.utils.multiclass import unique_labels
+import asyncio
+import atexit
 import io
-import base64
 import json
+import logging
+import math
 import os
+import pickle
+import re
+import shutil
+import tempfile
+import time
+import uuid
+import xxhash
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, fields
+from concurrent.futures import ThreadPoolExecutor
 
-app = FastAPI(title="ML Pipeline Builder API", version="1.0.0")
+# Copy-on-write lets session DataFrames share column buffers until one of them is modified
+pd.options.mode.copy_on_write = True
+
+# Uploads are spooled to disk in chunks of this size instead of read into memory at once
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Model fitting and evaluation run here so they never block the event loop
+executor = ThreadPoolExecutor(max_workers=2)
+
+# Session state is kept in Redis when REDIS_URL is set, otherwise in process memory
+REDIS_URL = os.getenv("REDIS_URL")
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
+SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+# Upper bound on sessions held by the in-memory store (each may hold DataFrames and a model)
+MAX_MEMORY_SESSIONS = int(os.getenv("MAX_MEMORY_SESSIONS", "16"))
+
+# Train/test feature matrices are written here as Feather files and memory-mapped on use.
+# With Redis, sessions outlive any one worker, so the directory must be set explicitly and
+# shared by all workers; otherwise it defaults to a private temporary directory removed at exit
+SPLIT_DATA_DIR = os.getenv("SPLIT_DATA_DIR")
+if SPLIT_DATA_DIR:
+    os.makedirs(SPLIT_DATA_DIR, mode=0o700, exist_ok=True)
+elif REDIS_URL:
+    raise RuntimeError("SPLIT_DATA_DIR must be set to a directory shared by all workers when REDIS_URL is set")
+else:
+    SPLIT_DATA_DIR = tempfile.mkdtemp(prefix="ml-pipeline-")
+    atexit.register(shutil.rmtree, SPLIT_DATA_DIR, ignore_errors=True)
+SPLIT_FRAME_PATTERN = re.compile(r"^(.+)_X_(?:train|test)\.arrow$")
+# How often split files of expired or evicted sessions are swept
+SPLIT_SWEEP_INTERVAL_SECONDS = 300
+
+# Targets with more distinct values than this are split without stratification
+MAX_STRATIFY_CLASSES = 50
+
+# Supported preprocessing methods and their display names
+SCALING_METHODS = {
+    "standardize": "StandardScaler (z-score normalization)",
+    "normalize": "MinMaxScaler (0-1 normalization)",
+}
+
+# Number of fitted (column, method) scaler parameters remembered per session
+SCALER_CACHE_SIZE = 64
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sweeper = asyncio.create_task(sweep_split_frames_periodically())
+    yield
+    sweeper.cancel()
+
+
+app = FastAPI(
+    title="ML Pipeline Builder API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # CORS middleware for frontend communication - allow all origins for deployment
 app.add_middleware(
@@ -35,20 +105,185 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory session state (for simplicity; use Redis/DB in production)
-session_state: Dict[str, Any] = {
-    "original_df": None,
-    "processed_df": None,
-    "X_train": None,
-    "X_test": None,
-    "y_train": None,
-    "y_test": None,
-    "target_column": None,
-    "feature_columns": None,
-    "model": None,
-    "model_name": None,
-    "transformations_applied": [],
-}
+
+@dataclass(slots=True)
+class SessionState:
+    """Pipeline state for one session"""
+    original_df: Optional[pd.DataFrame] = None
+    dataset_rows: Optional[int] = None
+    processed_df: Optional[pd.DataFrame] = None
+    X_train_path: Optional[str] = None
+    X_test_path: Optional[str] = None
+    y_train: Optional[pd.Series] = None
+    y_test: Optional[pd.Series] = None
+    target_column: Optional[str] = None
+    feature_columns: Optional[List[str]] = None
+    model: Any = None
+    model_name: Optional[str] = None
+    # Changes whenever the model is replaced; cached results are only valid for the token they carry
+    model_token: Optional[str] = None
+    transformations_applied: List[Dict[str, Any]] = field(default_factory=list)
+    scaler_cache: OrderedDict = field(default_factory=OrderedDict)
+    results_cache: Optional[Tuple[str, Dict[str, Any]]] = None
+
+
+SESSION_FIELDS = [f.name for f in fields(SessionState)]
+
+
+def pickle_value(value: Any) -> bytes:
+    """Pickle behind a b"P" tag, written into one buffer rather than concatenated afterwards"""
+    buf = io.BytesIO()
+    buf.write(b"P")
+    pickle.dump(value, buf, protocol=pickle.HIGHEST_PROTOCOL)
+    return buf.getvalue()
+
+
+def serialize_value(value: Any) -> bytes:
+    """Serialize a session value: DataFrames/Series as Arrow IPC streams, anything else pickled"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        tag = b"S" if isinstance(value, pd.Series) else b"D"
+        frame = value.to_frame() if isinstance(value, pd.Series) else value
+        try:
+            table = pa.Table.from_pandas(frame)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed-type object columns have no Arrow equivalent
+            return pickle_value(value)
+        # The tag goes into the sink first so the stream is copied out exactly once
+        sink = pa.BufferOutputStream()
+        sink.write(tag)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    return pickle_value(value)
+
+
+def deserialize_value(raw: bytes) -> Any:
+    """Inverse of serialize_value; the payload is read through a zero-copy memoryview"""
+    view = memoryview(raw)
+    tag, payload = raw[:1], view[1:]
+    if tag == b"P":
+        return pickle.loads(payload)
+    df = pa.ipc.open_stream(pa.py_buffer(payload)).read_pandas()
+    return df.iloc[:, 0] if tag == b"S" else df
+
+
+class InMemorySessionStore:
+    """
+    Keeps session state in process memory (single worker only)
+    Sessions idle for longer than ttl seconds are dropped, and at most max_sessions are kept
+    (least recently used evicted first)
+    """
+
+    def __init__(self, ttl: int, max_sessions: int):
+        self._sessions: OrderedDict[str, Tuple[float, SessionState]] = OrderedDict()
+        self._ttl = ttl
+        self._max_sessions = max_sessions
+
+    def _evict(self) -> None:
+        """Drop expired sessions, then the least recently used ones beyond max_sessions"""
+        now = time.monotonic()
+        while self._sessions:
+            session_id, (last_used, _) = next(iter(self._sessions.items()))
+            if now - last_used < self._ttl and len(self._sessions) <= self._max_sessions:
+                break
+            del self._sessions[session_id]
+            remove_split_frames(session_id)
+
+    async def load(self, session_id: str, names: Optional[List[str]] = None) -> SessionState:
+        """
+        Return a copy holding only the requested fields (like RedisSessionStore), or an empty
+        state (not stored until saved) for unknown sessions
+        """
+        self._evict()
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return SessionState()
+        self._sessions[session_id] = (time.monotonic(), entry[1])
+        self._sessions.move_to_end(session_id)
+        return SessionState(**{name: getattr(entry[1], name) for name in names or SESSION_FIELDS})
+
+    async def save(self, session_id: str, state: SessionState, names: Optional[List[str]] = None) -> None:
+        """Write back the given fields (all fields if omitted), leaving the others as stored"""
+        if names is None:
+            stored = state
+        else:
+            entry = self._sessions.get(session_id)
+            stored = entry[1] if entry is not None else SessionState()
+            for name in names:
+                setattr(stored, name, getattr(state, name))
+        self._sessions[session_id] = (time.monotonic(), stored)
+        self._sessions.move_to_end(session_id)
+        self._evict()
+
+    async def exists(self, session_id: str) -> bool:
+        self._evict()
+        return session_id in self._sessions
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class RedisSessionStore:
+    """
+    Keeps session state in Redis, one key per field ({session_id}:{field})
+    Shared across uvicorn workers and expired after SESSION_TTL_SECONDS
+    """
+
+    def __init__(self, url: str, ttl: int):
+        import redis.asyncio as redis
+        self._redis = redis.from_url(url)
+        self._ttl = ttl
+
+    def _refresh_ttl(self, pipe, session_id: str) -> None:
+        """Queue an EXPIRE on every field so a session's keys always expire together"""
+        for name in SESSION_FIELDS:
+            pipe.expire(f"{session_id}:{name}", self._ttl)
+
+    async def load(self, session_id: str, names: Optional[List[str]] = None) -> SessionState:
+        """Load only the requested fields; the rest keep their empty defaults"""
+        state = SessionState()
+        names = names or SESSION_FIELDS
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.mget([f"{session_id}:{name}" for name in names])
+            self._refresh_ttl(pipe, session_id)
+            values, *_ = await pipe.execute()
+        for name, raw in zip(names, values):
+            if raw is not None:
+                setattr(state, name, deserialize_value(raw))
+        return state
+
+    async def save(self, session_id: str, state: SessionState, names: Optional[List[str]] = None) -> None:
+        """Write back the given fields (all fields if omitted)"""
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for name in names or SESSION_FIELDS:
+                key = f"{session_id}:{name}"
+                value = getattr(state, name)
+                if value is None:
+                    pipe.delete(key)
+                else:
+                    pipe.set(key, serialize_value(value), ex=self._ttl)
+            self._refresh_ttl(pipe, session_id)
+            await pipe.execute()
+
+    async def exists(self, session_id: str) -> bool:
+        # Every session with data has dataset_rows, and all its keys expire together
+        return await self._redis.exists(f"{session_id}:dataset_rows") > 0
+
+    async def delete(self, session_id: str) -> None:
+        await self._redis.delete(*[f"{session_id}:{name}" for name in SESSION_FIELDS])
+
+
+session_store = (
+    RedisSessionStore(REDIS_URL, SESSION_TTL_SECONDS) if REDIS_URL
+    else InMemorySessionStore(SESSION_TTL_SECONDS, MAX_MEMORY_SESSIONS)
+)
+
+
+async def get_session_id(x_session_id: str = Header("default")) -> str:
+    """Identify the caller's pipeline session from the X-Session-ID header"""
+    if not SESSION_ID_PATTERN.match(x_session_id):
+        raise HTTPException(status_code=400, detail="Invalid X-Session-ID header")
+    return x_session_id
 
 
 # Pydantic models for request/response
@@ -57,6 +292,10 @@ class PreprocessRequest(BaseModel):
     method: str  # "standardize" or "normalize"
 
 
+class ReplayRequest(BaseModel):
+    transformations: List[PreprocessRequest]
+
+
 class SplitRequest(BaseModel):
     target_column: str
     test_size: float = 0.2
@@ -67,29 +306,272 @@ class TrainRequest(BaseModel):
     model_type: str  # "logistic_regression" or "decision_tree"
 
 
+def preview_cells(column: pd.Series) -> list:
+    """Preview values of one column: NumPy scalars for numeric columns, Python objects (None for missing) otherwise"""
+    if column.dtype.kind in "biuf":
+        return list(column.to_numpy())
+    return column.astype(object).where(column.notna(), None).tolist()
+
+
 def df_to_json(df: pd.DataFrame, max_rows: int = 100) -> Dict:
-    """Convert DataFrame to JSON-serializable format with preview"""
-    preview_df = df.head(max_rows).copy()
-    # Replace NaN/Inf with None for JSON compatibility
-    preview_df = preview_df.replace([np.inf, -np.inf], np.nan)
-    preview_df = preview_df.where(pd.notnull(preview_df), None)
+    """
+    Convert DataFrame to JSON-serializable format with preview
+    Numeric previews stay a NumPy array that orjson serializes directly (NaN/Inf become null)
+    """
+    preview_df = df.head(max_rows)
+    # Datetimes have no native JSON form
+    datetime_cols = preview_df.select_dtypes(include=['datetime', 'datetimetz', 'timedelta']).columns
+    if len(datetime_cols) > 0:
+        preview_df = preview_df.astype({col: str for col in datetime_cols})
+    
+    if preview_df.dtypes.nunique() == 1 and preview_df.dtypes.iloc[0].kind in "biuf":
+        data = np.ascontiguousarray(preview_df.to_numpy())
+    else:
+        # Mixed dtypes would be upcast to float64/object by to_numpy, printing float32 0.1 as
+        # 0.10000000149011612; build rows from per-column cells so numeric cells keep their dtype
+        cells = [preview_cells(preview_df.iloc[:, j]) for j in range(preview_df.shape[1])]
+        data = [list(row) for row in zip(*cells)]
     return {
         "columns": df.columns.tolist(),
-        "data": preview_df.values.tolist(),
+        "data": data,
         "dtypes": df.dtypes.astype(str).to_dict(),
         "total_rows": len(df),
         "preview_rows": len(preview_df),
     }
 
 
-def fig_to_base64(fig) -> str:
-    """Convert matplotlib figure to base64 string"""
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-    buf.seek(0)
-    img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-    plt.close(fig)
-    return img_base64
+def fits_float32(values: np.ndarray) -> bool:
+    """
+    True when float32 keeps every value as written: within float32's normal range and
+    with at most 6 significant digits (FLT_DIG), so the float32 prints back as the same number
+    """
+    values = values[np.isfinite(values) & (values != 0)]
+    if values.size == 0:
+        return True
+    magnitude = np.abs(values)
+    info = np.finfo(np.float32)
+    if magnitude.max() > info.max or magnitude.min() < info.tiny:
+        return False
+    
+    # Round each value to 6 significant digits and check nothing changed
+    decimals = 5 - np.floor(np.log10(magnitude))
+    scale = 10.0 ** np.abs(decimals)
+    rounded = np.where(
+        decimals >= 0,
+        np.round(values * scale) / scale,
+        np.round(values / scale) * scale,
+    )
+    return bool(np.array_equal(rounded, values))
+
+
+def downcast_numeric(df: pd.DataFrame):
+    """
+    Downcast int64/float64 columns in place to the smallest dtype that holds their values
+    Returns the float columns that had to stay float64 to keep their precision
+    """
+    for col in df.select_dtypes(include=['integer']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    # pd.to_numeric(downcast='float') accepts any float32 value within an absolute 5e-4,
+    # which silently changes small or high-precision values, so check the round trip here
+    float64_columns = []
+    for col in df.select_dtypes(include=['float64']).columns:
+        if fits_float32(df[col].to_numpy()):
+            df[col] = df[col].astype(np.float32)
+        else:
+            float64_columns.append(col)
+    return float64_columns
+
+
+def validate_scaling_columns(df: pd.DataFrame, columns: List[str]) -> None:
+    """Raise a 400 unless every column exists and is numeric"""
+    invalid_cols = [col for col in columns if col not in df.columns]
+    if invalid_cols:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid columns: {invalid_cols}. Available columns: {df.columns.tolist()}"
+        )
+    
+    non_numeric = [col for col in columns if not np.issubdtype(df[col].dtype, np.number)]
+    if non_numeric:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Columns must be numeric for transformation: {non_numeric}"
+        )
+
+
+def fit_scaler_params(arr: np.ndarray, method: str):
+    """
+    Compute per-column (offset, scale) so that (arr - offset) / scale matches
+    StandardScaler ("standardize") or MinMaxScaler ("normalize"); NaNs are ignored
+    """
+    if method == "standardize":
+        offset = np.nanmean(arr, axis=0)
+        scale = np.nanstd(arr, axis=0)
+    else:
+        offset = np.nanmin(arr, axis=0)
+        scale = np.nanmax(arr, axis=0) - offset
+    # Constant columns are left centred rather than divided by zero
+    scale[scale == 0] = 1
+    return offset, scale
+
+
+def cached_scaler_params(df: pd.DataFrame, columns: List[str], arr: np.ndarray, method: str, cache: OrderedDict):
+    """
+    Look up fitted scaler params per column in an LRU cache keyed by
+    (column, method, content hash); only cache misses are fitted.
+    Returns (offset, scale, all_cached)
+    """
+    keys = [
+        (col, method, df[col].dtype.str, xxhash.xxh3_64_intdigest(np.ascontiguousarray(df[col].to_numpy())))
+        for col in columns
+    ]
+    missing = [i for i, key in enumerate(keys) if key not in cache]
+    if missing:
+        offset, scale = fit_scaler_params(arr[:, missing], method)
+        for j, i in enumerate(missing):
+            cache[keys[i]] = (float(offset[j]), float(scale[j]))
+    
+    params = np.array([cache[key] for key in keys], dtype=arr.dtype).reshape(-1, 2)
+    for key in keys:
+        cache.move_to_end(key)
+    while len(cache) > SCALER_CACHE_SIZE:
+        cache.popitem(last=False)
+    return params[:, 0], params[:, 1], not missing
+
+
+def split_frame_path(session_id: str, name: str) -> str:
+    """Location of a session's split feature matrix ("X_train" or "X_test")"""
+    return os.path.join(SPLIT_DATA_DIR, f"{session_id}_{name}.arrow")
+
+
+def write_split_frame(df: pd.DataFrame, path: str) -> None:
+    """
+    Write uncompressed Feather (so it can be memory-mapped), replacing any previous file atomically
+    The file is readable by the owner only
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        feather.write_feather(df, f, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def read_split_frame(path: str) -> pd.DataFrame:
+    """Memory-map a split feature matrix; the OS pages in only the columns that are touched"""
+    return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+
+
+def remove_split_frames(session_id: str) -> None:
+    """Delete a session's split feature matrices, if any"""
+    for name in ("X_train", "X_test"):
+        path = split_frame_path(session_id, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+async def sweep_split_frames() -> None:
+    """Delete split feature matrices left behind by sessions that expired or were evicted"""
+    session_ids = {
+        match.group(1)
+        for match in map(SPLIT_FRAME_PATTERN.match, os.listdir(SPLIT_DATA_DIR))
+        if match
+    }
+    for session_id in session_ids:
+        if not await session_store.exists(session_id):
+            remove_split_frames(session_id)
+
+
+async def sweep_split_frames_periodically():
+    """Background task: remove split files whose session is gone"""
+    while True:
+        await asyncio.sleep(SPLIT_SWEEP_INTERVAL_SECONDS)
+        try:
+            await sweep_split_frames()
+        except Exception:
+            # Store unreachable or file busy; retried on the next sweep
+            logger.exception("Sweeping split feature matrices failed")
+
+
+def read_csv_file(path: str) -> pd.DataFrame:
+    """Parse a CSV file with the multithreaded pyarrow engine, falling back to the C engine"""
+    try:
+        return pd.read_csv(path, engine='pyarrow')
+    except (pa.ArrowInvalid, ValueError):
+        # pyarrow rejects some quirky files (ragged rows, odd quoting) the C parser tolerates
+        return pd.read_csv(path, engine='c', low_memory=False)
+
+
+def evaluate_model(model, model_name: str, X_test: pd.DataFrame, y_test: pd.Series, feature_columns: List[str]) -> Dict:
+    """
+    Predict on the test set and build the chart data the frontend renders
+    (blocking; run in the executor)
+    """
+    # Make predictions
+    y_pred = model.predict(X_test)
+    
+    # Calculate accuracy
+    accuracy = accuracy_score(y_test, y_pred)
+    
+    # Generate confusion matrix (rows/columns follow the sorted labels)
+    labels = unique_labels(y_test, y_pred)
+    cm = confusion_matrix(y_test, y_pred, labels=labels)
+    
+    # Generate model-specific visualization data
+    model_viz = None
+    
+    if isinstance(model, DecisionTreeClassifier):
+        # Decision tree as Graphviz DOT plus a plain-text rendering
+        class_names = [str(c) for c in model.classes_]
+        model_viz = {
+            "title": "Decision Tree Structure",
+            "type": "decision_tree",
+            "dot": export_graphviz(
+                model,
+                out_file=None,
+                feature_names=feature_columns,
+                class_names=class_names,
+                filled=True,
+                rounded=True,
+            ),
+            "text": export_text(model, feature_names=feature_columns),
+        }
+        
+    elif isinstance(model, LogisticRegression):
+        # Feature Importance (coefficients, handle multi-class)
+        if len(model.coef_.shape) > 1 and model.coef_.shape[0] > 1:
+            importance = np.mean(np.abs(model.coef_), axis=0)
+        else:
+            importance = np.abs(model.coef_).flatten()
+        
+        # Sort by importance
+        indices = np.argsort(importance)[::-1]
+        model_viz = {
+            "title": "Feature Importance",
+            "type": "feature_importance",
+            "features": [feature_columns[i] for i in indices],
+            "importance": importance[indices].tolist(),
+        }
+    
+    return {
+        "success": True,
+        "message": "Model evaluation complete!",
+        "results": {
+            "model_name": model_name,
+            "accuracy": round(accuracy * 100, 2),
+            "accuracy_decimal": round(accuracy, 4),
+            "test_samples": len(y_test),
+            "confusion_matrix": cm.tolist(),
+        },
+        "visualizations": {
+            "confusion_matrix": {
+                "title": "Confusion Matrix",
+                "matrix": cm.tolist(),
+                "labels": labels.tolist(),
+            },
+            "model_specific": model_viz,
+        }
+    }
 
 
 @app.get("/")
@@ -99,7 +581,7 @@ async def root():
 
 
 @app.post("/upload")
-async def upload_dataset(file: UploadFile = File(...)):
+async def upload_dataset(file: UploadFile = File(...), session_id: str = Depends(get_session_id)):
     """
     Upload CSV or Excel file and store in session state
     Returns dataset info and preview
@@ -113,14 +595,22 @@ async def upload_dataset(file: UploadFile = File(...)):
                 detail="Invalid file type. Please upload a CSV or Excel file (.csv, .xlsx, .xls)"
             )
         
-        # Read file content
-        content = await file.read()
-        
-        # Parse based on file type
-        if filename.endswith('.csv'):
-            df = pd.read_csv(io.BytesIO(content))
-        else:
-            df = pd.read_excel(io.BytesIO(content))
+        # Stream file content to a temporary file so only one chunk is held in memory
+        ext = os.path.splitext(filename)[1]
+        tmp = tempfile.NamedTemporaryFile(suffix=ext, delete=False)
+        tmp_path = tmp.name
+        try:
+            with tmp:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    tmp.write(chunk)
+            
+            # Parse based on file type directly from disk
+            if filename.endswith('.csv'):
+                df = read_csv_file(tmp_path)
+            else:
+                df = pd.read_excel(tmp_path)
+        finally:
+            os.unlink(tmp_path)
         
         # Validate dataset
         if df.empty:
@@ -135,22 +625,21 @@ async def upload_dataset(file: UploadFile = File(...)):
         # Handle NaN and Inf values - replace Inf with NaN, then fill NaN with 0 for numeric columns
         df = df.replace([np.inf, -np.inf], np.nan)
         
-        # Store in session state
-        session_state["original_df"] = df.copy()
-        session_state["processed_df"] = df.copy()
-        session_state["transformations_applied"] = []
+        # Halve memory and bandwidth for every downstream step by downcasting numeric columns
+        float64_columns = downcast_numeric(df)
         
-        # Reset downstream state
-        session_state["X_train"] = None
-        session_state["X_test"] = None
-        session_state["y_train"] = None
-        session_state["y_test"] = None
-        session_state["model"] = None
+        # Store in a fresh session state (resets all downstream state)
+        remove_split_frames(session_id)
+        state = SessionState()
+        state.original_df = df
+        state.dataset_rows = len(df)
+        state.processed_df = df
+        await session_store.save(session_id, state)
         
-        # Count NaN values for info
-        nan_count = int(df.isna().sum().sum())
+        # Count NaN values for info (count() scans once without materializing a boolean frame)
+        nan_count = int(df.size - df.count().sum())
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": f"Successfully uploaded {file.filename}" + (f" ({nan_count} missing values detected)" if nan_count > 0 else ""),
             "dataset_info": {
@@ -161,6 +650,10 @@ async def upload_dataset(file: UploadFile = File(...)):
                 "dtypes": df.dtypes.astype(str).to_dict(),
             },
             "preview": df_to_json(df),
+            "warnings": [
+                f"Column '{col}' kept as float64: its values lose precision in float32"
+                for col in float64_columns
+            ],
         })
         
     except HTTPException:
@@ -170,13 +663,14 @@ async def upload_dataset(file: UploadFile = File(...)):
 
 
 @app.get("/dataset")
-async def get_dataset():
+async def get_dataset(session_id: str = Depends(get_session_id)):
     """Get current dataset info and preview"""
-    if session_state["processed_df"] is None:
+    state = await session_store.load(session_id, ["processed_df", "transformations_applied"])
+    if state.processed_df is None:
         raise HTTPException(status_code=400, detail="No dataset uploaded. Please upload a dataset first.")
     
-    df = session_state["processed_df"]
-    return JSONResponse({
+    df = state.processed_df
+    return ORJSONResponse({
         "success": True,
         "dataset_info": {
             "rows": len(df),
@@ -185,64 +679,60 @@ async def get_dataset():
             "dtypes": df.dtypes.astype(str).to_dict(),
         },
         "preview": df_to_json(df),
-        "transformations_applied": session_state["transformations_applied"],
+        "transformations_applied": state.transformations_applied,
     })
 
 
 @app.post("/preprocess")
-async def preprocess_data(request: PreprocessRequest):
+async def preprocess_data(request: PreprocessRequest, session_id: str = Depends(get_session_id)):
     """
     Apply preprocessing transformations to selected columns
     Supports: standardization (StandardScaler) and normalization (MinMaxScaler)
     """
-    if session_state["processed_df"] is None:
+    state = await session_store.load(
+        session_id, ["processed_df", "transformations_applied", "scaler_cache"]
+    )
+    if state.processed_df is None:
         raise HTTPException(status_code=400, detail="No dataset uploaded. Please upload a dataset first.")
     
-    df = session_state["processed_df"].copy()
+    # Shallow copy: only the columns overwritten below get new buffers
+    df = state.processed_df.copy(deep=False)
     
-    # Validate columns
-    invalid_cols = [col for col in request.columns if col not in df.columns]
-    if invalid_cols:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid columns: {invalid_cols}. Available columns: {df.columns.tolist()}"
-        )
-    
-    # Check if columns are numeric
-    non_numeric = [col for col in request.columns if not np.issubdtype(df[col].dtype, np.number)]
-    if non_numeric:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Columns must be numeric for transformation: {non_numeric}"
-        )
+    # Validate columns (must exist and be numeric)
+    validate_scaling_columns(df, request.columns)
     
     # Apply transformation
     try:
-        if request.method == "standardize":
-            scaler = StandardScaler()
-            method_name = "StandardScaler (z-score normalization)"
-        elif request.method == "normalize":
-            scaler = MinMaxScaler()
-            method_name = "MinMaxScaler (0-1 normalization)"
-        else:
+        method_name = SCALING_METHODS.get(request.method)
+        if method_name is None:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid method. Use 'standardize' or 'normalize'"
             )
         
-        # Apply scaler to selected columns
-        df[request.columns] = scaler.fit_transform(df[request.columns])
+        # Scale selected columns in place on a single float32 copy of their values
+        arr = df[request.columns].to_numpy(dtype=np.float32, copy=True)
+        offset, scale, cached_applied = cached_scaler_params(
+            df, request.columns, arr, request.method, state.scaler_cache
+        )
+        arr -= offset
+        arr /= scale
+        df[request.columns] = arr
         
         # Update session state
-        session_state["processed_df"] = df
+        state.processed_df = df
         transformation_msg = f"Applied {method_name} to columns: {request.columns}"
-        session_state["transformations_applied"].append(transformation_msg)
+        state.transformations_applied.append(request.model_dump())
+        await session_store.save(
+            session_id, state, ["processed_df", "transformations_applied", "scaler_cache"]
+        )
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": transformation_msg,
             "preview": df_to_json(df),
-            "transformations_applied": session_state["transformations_applied"],
+            "transformations_applied": state.transformations_applied,
+            "cached_applied": cached_applied,
         })
         
     except Exception as e:
@@ -250,31 +740,94 @@ async def preprocess_data(request: PreprocessRequest):
 
 
 @app.post("/reset-preprocessing")
-async def reset_preprocessing():
+async def reset_preprocessing(session_id: str = Depends(get_session_id)):
     """Reset dataset to original state (undo all preprocessing)"""
-    if session_state["original_df"] is None:
+    state = await session_store.load(session_id, ["original_df"])
+    if state.original_df is None:
         raise HTTPException(status_code=400, detail="No dataset uploaded.")
     
-    session_state["processed_df"] = session_state["original_df"].copy()
-    session_state["transformations_applied"] = []
+    state.processed_df = state.original_df.copy()
+    state.transformations_applied = []
+    await session_store.save(session_id, state, ["processed_df", "transformations_applied"])
     
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
         "message": "Dataset reset to original state",
-        "preview": df_to_json(session_state["processed_df"]),
+        "preview": df_to_json(state.processed_df),
     })
 
 
+@app.post("/replay-preprocessing")
+async def replay_preprocessing(request: ReplayRequest, session_id: str = Depends(get_session_id)):
+    """
+    Re-apply a list of transformations to the original dataset in a single pass
+    Each scaler refits on its input and is a positive affine map, so only the last
+    method applied to a column affects the result; all scaled columns share one array
+    """
+    state = await session_store.load(session_id, ["original_df", "scaler_cache"])
+    if state.original_df is None:
+        raise HTTPException(status_code=400, detail="No dataset uploaded.")
+    
+    original_df = state.original_df
+    invalid_methods = sorted({t.method for t in request.transformations} - set(SCALING_METHODS))
+    if invalid_methods:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid methods: {invalid_methods}. Use 'standardize' or 'normalize'"
+        )
+    
+    final_method: Dict[str, str] = {}
+    for transformation in request.transformations:
+        for col in transformation.columns:
+            final_method[col] = transformation.method
+    columns = list(final_method)
+    validate_scaling_columns(original_df, columns)
+    
+    try:
+        df = original_df.copy(deep=False)
+        if columns:
+            arr = df[columns].to_numpy(dtype=np.float32, copy=True)
+            offset = np.empty(len(columns), dtype=np.float32)
+            scale = np.empty(len(columns), dtype=np.float32)
+            for method in SCALING_METHODS:
+                idx = [i for i, col in enumerate(columns) if final_method[col] == method]
+                if idx:
+                    offset[idx], scale[idx], _ = cached_scaler_params(
+                        original_df, [columns[i] for i in idx], arr[:, idx], method, state.scaler_cache
+                    )
+            arr -= offset
+            arr /= scale
+            df[columns] = arr
+        
+        # Update session state
+        state.processed_df = df
+        state.transformations_applied = [t.model_dump() for t in request.transformations]
+        await session_store.save(
+            session_id, state, ["processed_df", "transformations_applied", "scaler_cache"]
+        )
+        
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Replayed {len(request.transformations)} transformations",
+            "preview": df_to_json(df),
+            "transformations_applied": state.transformations_applied,
+        })
+        
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error during preprocessing: {str(e)}")
+
+
 @app.post("/split")
-async def split_data(request: SplitRequest):
+async def split_data(request: SplitRequest, session_id: str = Depends(get_session_id)):
     """
     Split dataset into train and test sets
-    Stores X_train, X_test, y_train, y_test in session state
+    Writes X_train/X_test to Feather files and stores their paths, y_train, y_test in session state
     """
-    if session_state["processed_df"] is None:
+    state = await session_store.load(session_id, ["processed_df"])
+    if state.processed_df is None:
         raise HTTPException(status_code=400, detail="No dataset uploaded. Please upload a dataset first.")
     
-    df = session_state["processed_df"]
+    df = state.processed_df
     
     # Validate target column
     if request.target_column not in df.columns:
@@ -300,25 +853,28 @@ async def split_data(request: SplitRequest):
         X = df_clean.drop(columns=[request.target_column])
         y = df_clean[request.target_column]
         
-        # Check class distribution
+        # Check class distribution (one hashing pass, reused below)
         class_counts = y.value_counts()
+        n_classes = len(class_counts)
         min_class_count = class_counts.min()
         
-        if min_class_count < 2:
-            small_classes = class_counts[class_counts < 2].index.tolist()
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Classes {small_classes} have less than 2 samples. Each class needs at least 2 samples for train/test split. Remove these rows or choose a different target column."
-            )
-        
         # Handle non-numeric features (simple encoding for demo)
-        X_encoded = X.copy()
-        for col in X_encoded.columns:
-            if X_encoded[col].dtype == 'object':
-                X_encoded[col] = pd.factorize(X_encoded[col])[0]
+        # Categorical codes use the smallest int dtype that fits (int8 for <=127 categories)
+        # The pyarrow CSV parser reads timestamps as datetimes, which are encoded the same way
+        X_encoded = X
+        object_cols = X.select_dtypes(include=['object', 'datetime', 'datetimetz', 'timedelta']).columns
+        if len(object_cols) > 0:
+            X_encoded = X.copy(deep=False)
+            X_encoded[object_cols] = X[object_cols].apply(lambda s: pd.Categorical(s).codes)
         
-        # Determine if stratify is possible
-        use_stratify = min_class_count >= 2 and len(y.unique()) > 1
+        # Stratify only when every class can appear in both sets; otherwise (rare classes,
+        # regression-like targets) fall back to a plain shuffled split instead of failing
+        n_test = math.ceil(request.test_size * len(y))
+        use_stratify = (
+            2 <= n_classes <= MAX_STRATIFY_CLASSES
+            and min_class_count >= 2
+            and min(n_test, len(y) - n_test) >= n_classes
+        )
         
         # Perform split
         X_train, X_test, y_train, y_test = train_test_split(
@@ -329,21 +885,29 @@ async def split_data(request: SplitRequest):
         )
         
         # Store in session state
-        session_state["X_train"] = X_train
-        session_state["X_test"] = X_test
-        session_state["y_train"] = y_train
-        session_state["y_test"] = y_test
-        session_state["target_column"] = request.target_column
-        session_state["feature_columns"] = X.columns.tolist()
+        state.X_train_path = split_frame_path(session_id, "X_train")
+        state.X_test_path = split_frame_path(session_id, "X_test")
+        write_split_frame(X_train, state.X_train_path)
+        write_split_frame(X_test, state.X_test_path)
+        state.y_train = y_train
+        state.y_test = y_test
+        state.target_column = request.target_column
+        state.feature_columns = X.columns.tolist()
         
-        # Reset model when split changes
-        session_state["model"] = None
-        session_state["model_name"] = None
+        # Reset model (and its cached results) when split changes
+        state.model = None
+        state.model_name = None
+        state.model_token = None
+        state.results_cache = None
+        await session_store.save(session_id, state, [
+            "X_train_path", "X_test_path", "y_train", "y_test", "target_column",
+            "feature_columns", "model", "model_name", "model_token", "results_cache",
+        ])
         
         train_ratio = int((1 - request.test_size) * 100)
         test_ratio = int(request.test_size * 100)
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": f"Data split successfully ({train_ratio}% train, {test_ratio}% test)",
             "split_info": {
@@ -354,7 +918,8 @@ async def split_data(request: SplitRequest):
                 "target_column": request.target_column,
                 "feature_columns": X.columns.tolist(),
                 "num_features": len(X.columns),
-                "target_classes": y.unique().tolist(),
+                "target_classes": class_counts.index.tolist(),
+                "stratified": use_stratify,
             }
         })
         
@@ -365,25 +930,28 @@ async def split_data(request: SplitRequest):
 
 
 @app.post("/train")
-async def train_model(request: TrainRequest):
+async def train_model(request: TrainRequest, session_id: str = Depends(get_session_id)):
     """
     Train selected model on the split data
     Supports: Logistic Regression, Decision Tree Classifier
     """
+    state = await session_store.load(session_id, ["X_train_path", "y_train", "feature_columns"])
     # Validate prerequisites
-    if session_state["X_train"] is None:
+    if state.X_train_path is None:
         raise HTTPException(
             status_code=400,
             detail="Data not split. Please perform train-test split first."
         )
     
-    X_train = session_state["X_train"]
-    y_train = session_state["y_train"]
+    y_train = state.y_train
     
     try:
+        X_train = read_split_frame(state.X_train_path)
+        
         # Select and train model
         if request.model_type == "logistic_regression":
-            model = LogisticRegression(max_iter=1000, random_state=42)
+            # saga with a looser tolerance converges in far fewer iterations than the lbfgs default
+            model = LogisticRegression(max_iter=1000, random_state=42, solver='saga', n_jobs=-1, tol=1e-3)
             model_name = "Logistic Regression"
         elif request.model_type == "decision_tree":
             model = DecisionTreeClassifier(max_depth=5, random_state=42)
@@ -394,184 +962,116 @@ async def train_model(request: TrainRequest):
                 detail="Invalid model type. Use 'logistic_regression' or 'decision_tree'"
             )
         
-        # Train the model
-        model.fit(X_train, y_train)
+        # Train the model in the executor so other requests are served meanwhile
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, model.fit, X_train, y_train)
+        
+        # The dataset may have been replaced or reset while the model was fitting
+        current = await session_store.load(session_id, ["X_train_path"])
+        if current.X_train_path is None:
+            raise HTTPException(
+                status_code=409,
+                detail="Dataset changed during training. Please split the data and train again."
+            )
         
         # Store in session state
-        session_state["model"] = model
-        session_state["model_name"] = model_name
+        state.model = model
+        state.model_name = model_name
+        state.model_token = uuid.uuid4().hex
+        state.results_cache = None
+        await session_store.save(session_id, state, ["model", "model_name", "model_token", "results_cache"])
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": f"{model_name} trained successfully!",
             "model_info": {
                 "model_type": request.model_type,
                 "model_name": model_name,
                 "training_samples": len(X_train),
-                "features_used": session_state["feature_columns"],
+                "features_used": state.feature_columns,
+                "solver": getattr(model, "solver", None),
             }
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error during training: {str(e)}")
 
 
 @app.get("/results")
-async def get_results():
+async def get_results(session_id: str = Depends(get_session_id)):
     """
-    Get model evaluation results including accuracy and visualizations
-    Returns confusion matrix and feature importance/decision tree plot
+    Get model evaluation results including accuracy and visualization data
+    Returns confusion matrix and feature importance/decision tree structure for client-side rendering
     """
-    if session_state["model"] is None:
+    # Serve the cached evaluation while it belongs to the current model
+    state = await session_store.load(session_id, ["results_cache", "model_token"])
+    if state.results_cache is not None and state.results_cache[0] == state.model_token:
+        return ORJSONResponse(state.results_cache[1])
+    
+    state = await session_store.load(
+        session_id, ["model", "model_name", "model_token", "X_test_path", "y_test", "feature_columns"]
+    )
+    if state.model is None:
         raise HTTPException(
             status_code=400,
             detail="No model trained. Please train a model first."
         )
     
-    model = session_state["model"]
-    model_name = session_state["model_name"]
-    X_test = session_state["X_test"]
-    y_test = session_state["y_test"]
-    feature_columns = session_state["feature_columns"]
+    model = state.model
+    model_name = state.model_name
+    model_token = state.model_token
+    y_test = state.y_test
+    feature_columns = state.feature_columns
     
     try:
-        # Make predictions
-        y_pred = model.predict(X_test)
-        
-        # Calculate accuracy
-        accuracy = accuracy_score(y_test, y_pred)
-        
-        # Generate confusion matrix
-        cm = confusion_matrix(y_test, y_pred)
-        
-        # Create confusion matrix visualization
-        fig_cm, ax_cm = plt.subplots(figsize=(8, 6))
-        sns.heatmap(
-            cm, annot=True, fmt='d', cmap='Blues',
-            xticklabels=sorted(y_test.unique()),
-            yticklabels=sorted(y_test.unique()),
-            ax=ax_cm
+        X_test = read_split_frame(state.X_test_path)
+        
+        # Prediction is CPU-bound, keep it off the event loop
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(
+            executor, evaluate_model, model, model_name, X_test, y_test, feature_columns
         )
-        ax_cm.set_xlabel('Predicted Label', fontsize=12)
-        ax_cm.set_ylabel('True Label', fontsize=12)
-        ax_cm.set_title('Confusion Matrix', fontsize=14, fontweight='bold')
-        cm_base64 = fig_to_base64(fig_cm)
-        
-        # Generate model-specific visualization
-        model_viz_base64 = None
-        viz_title = None
-        
-        if isinstance(model, DecisionTreeClassifier):
-            # Decision Tree Plot
-            fig_tree, ax_tree = plt.subplots(figsize=(20, 10))
-            plot_tree(
-                model,
-                feature_names=feature_columns,
-                class_names=[str(c) for c in sorted(y_test.unique())],
-                filled=True,
-                rounded=True,
-                ax=ax_tree,
-                fontsize=10
-            )
-            ax_tree.set_title('Decision Tree Visualization', fontsize=14, fontweight='bold')
-            model_viz_base64 = fig_to_base64(fig_tree)
-            viz_title = "Decision Tree Structure"
-            
-        elif isinstance(model, LogisticRegression):
-            # Feature Importance (coefficients)
-            fig_imp, ax_imp = plt.subplots(figsize=(10, 6))
-            
-            # Get coefficients (handle multi-class)
-            if len(model.coef_.shape) > 1 and model.coef_.shape[0] > 1:
-                importance = np.mean(np.abs(model.coef_), axis=0)
-            else:
-                importance = np.abs(model.coef_).flatten()
-            
-            # Sort by importance
-            indices = np.argsort(importance)[::-1]
-            sorted_features = [feature_columns[i] for i in indices]
-            sorted_importance = importance[indices]
-            
-            # Create bar plot
-            colors = plt.cm.Blues(np.linspace(0.4, 0.8, len(sorted_features)))
-            bars = ax_imp.barh(range(len(sorted_features)), sorted_importance, color=colors)
-            ax_imp.set_yticks(range(len(sorted_features)))
-            ax_imp.set_yticklabels(sorted_features)
-            ax_imp.invert_yaxis()
-            ax_imp.set_xlabel('Absolute Coefficient Value', fontsize=12)
-            ax_imp.set_title('Feature Importance (Logistic Regression)', fontsize=14, fontweight='bold')
-            
-            # Add value labels
-            for bar, val in zip(bars, sorted_importance):
-                ax_imp.text(val + 0.01, bar.get_y() + bar.get_height()/2, 
-                           f'{val:.3f}', va='center', fontsize=9)
-            
-            plt.tight_layout()
-            model_viz_base64 = fig_to_base64(fig_imp)
-            viz_title = "Feature Importance"
         
-        return JSONResponse({
-            "success": True,
-            "message": "Model evaluation complete!",
-            "results": {
-                "model_name": model_name,
-                "accuracy": round(accuracy * 100, 2),
-                "accuracy_decimal": round(accuracy, 4),
-                "test_samples": len(y_test),
-                "confusion_matrix": cm.tolist(),
-            },
-            "visualizations": {
-                "confusion_matrix": {
-                    "title": "Confusion Matrix",
-                    "image": cm_base64,
-                },
-                "model_specific": {
-                    "title": viz_title,
-                    "image": model_viz_base64,
-                } if model_viz_base64 else None,
-            }
-        })
+        # Only cache if /train or /split did not replace the model while it was being evaluated
+        state = await session_store.load(session_id, ["model_token"])
+        if state.model_token == model_token:
+            state.results_cache = (model_token, content)
+            await session_store.save(session_id, state, ["results_cache"])
+        return ORJSONResponse(content)
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error generating results: {str(e)}")
 
 
 @app.get("/pipeline-status")
-async def get_pipeline_status():
+async def get_pipeline_status(session_id: str = Depends(get_session_id)):
     """Get current status of all pipeline steps"""
-    return JSONResponse({
-        "upload": session_state["original_df"] is not None,
-        "preprocess": len(session_state["transformations_applied"]) > 0,
-        "split": session_state["X_train"] is not None,
-        "train": session_state["model"] is not None,
-        "results": session_state["model"] is not None,
+    state = await session_store.load(session_id, [
+        "dataset_rows", "transformations_applied", "X_train_path", "model", "model_name", "target_column",
+    ])
+    return ORJSONResponse({
+        "upload": state.dataset_rows is not None,
+        "preprocess": len(state.transformations_applied) > 0,
+        "split": state.X_train_path is not None,
+        "train": state.model is not None,
+        "results": state.model is not None,
         "details": {
-            "dataset_rows": len(session_state["original_df"]) if session_state["original_df"] is not None else 0,
-            "transformations": session_state["transformations_applied"],
-            "model_name": session_state["model_name"],
-            "target_column": session_state["target_column"],
+            "dataset_rows": state.dataset_rows or 0,
+            "transformations": state.transformations_applied,
+            "model_name": state.model_name,
+            "target_column": state.target_column,
         }
     })
 
 
 @app.post("/reset")
-async def reset_pipeline():
+async def reset_pipeline(session_id: str = Depends(get_session_id)):
     """Reset entire pipeline to initial state"""
-    global session_state
-    session_state = {
-        "original_df": None,
-        "processed_df": None,
-        "X_train": None,
-        "X_test": None,
-        "y_train": None,
-        "y_test": None,
-        "target_column": None,
-        "feature_columns": None,
-        "model": None,
-        "model_name": None,
-        "transformations_applied": [],
-    }
-    return JSONResponse({
+    remove_split_frames(session_id)
+    await session_store.delete(session_id)
+    return ORJSONResponse({
         "success": True,
         "message": "Pipeline reset successfully"
     })
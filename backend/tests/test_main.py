@@ -0,0 +1,289 @@
+"""
+API tests for the ML Pipeline Builder backend
+Run from backend/: python -m pytest
+"""
+
+import asyncio
+import io
+import os
+import stat
+import time
+import uuid
+from collections import OrderedDict
+
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+from app import main
+from app.main import app, InMemorySessionStore, SessionState
+
+
+@pytest.fixture
+def client():
+    """Test client bound to a fresh pipeline session"""
+    with TestClient(app, headers={"X-Session-ID": uuid.uuid4().hex}) as client:
+        yield client
+
+
+def upload_csv(client, df: pd.DataFrame):
+    buf = io.BytesIO(df.to_csv(index=False).encode())
+    return client.post("/upload", files={"file": ("data.csv", buf, "text/csv")})
+
+
+def preview_column(response, column: str) -> np.ndarray:
+    """One column of a preview as floats, with nulls back as NaN"""
+    preview = response.json()["preview"]
+    j = preview["columns"].index(column)
+    return np.array([np.nan if row[j] is None else row[j] for row in preview["data"]], dtype=np.float64)
+
+
+def make_dataset(rows: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "x1": rng.normal(size=rows),
+        "x2": rng.normal(size=rows),
+        "label": rng.integers(0, 2, rows),
+    })
+
+
+def test_train_with_timestamp_column(client):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "created_at": pd.date_range("2020-01-01 10:00:00", periods=60, freq="h").astype(str),
+        "value": rng.normal(size=60),
+        "label": rng.integers(0, 2, 60),
+    })
+    
+    response = upload_csv(client, df)
+    assert response.status_code == 200, response.text
+    
+    response = client.post("/split", json={"target_column": "label", "test_size": 0.2})
+    assert response.status_code == 200, response.text
+    
+    for model_type in ("logistic_regression", "decision_tree"):
+        response = client.post("/train", json={"model_type": model_type})
+        assert response.status_code == 200, response.text
+        response = client.get("/results")
+        assert response.status_code == 200, response.text
+
+
+def test_in_memory_store_evicts_idle_and_least_recent_sessions():
+    store = InMemorySessionStore(ttl=3600, max_sessions=2)
+    
+    async def scenario():
+        # Reading an unknown session does not create it
+        await store.load("unknown")
+        assert "unknown" not in store._sessions
+        
+        for session_id in ("a", "b"):
+            await store.save(session_id, SessionState(target_column=session_id))
+        await store.load("a")
+        await store.save("c", SessionState(target_column="c"))
+        assert list(store._sessions) == ["a", "c"]
+        
+        store._ttl = 0
+        await store.load("a")
+        assert not store._sessions
+    
+    asyncio.run(scenario())
+
+
+def async_client() -> httpx.AsyncClient:
+    """Client for issuing overlapping requests against one fresh session"""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        headers={"X-Session-ID": uuid.uuid4().hex},
+    )
+
+
+def test_results_not_cached_for_replaced_model(monkeypatch):
+    evaluate_model = main.evaluate_model
+    
+    def slow_evaluate_model(*args):
+        time.sleep(0.5)
+        return evaluate_model(*args)
+    
+    async def scenario():
+        async with async_client() as client:
+            assert (await upload_csv(client, make_dataset())).status_code == 200
+            assert (await client.post("/split", json={"target_column": "label"})).status_code == 200
+            assert (await client.post("/train", json={"model_type": "logistic_regression"})).status_code == 200
+            
+            # Evaluate the logistic regression while a decision tree replaces it
+            monkeypatch.setattr(main, "evaluate_model", slow_evaluate_model)
+            stale_results = asyncio.create_task(client.get("/results"))
+            await asyncio.sleep(0.1)
+            assert (await client.post("/train", json={"model_type": "decision_tree"})).status_code == 200
+            assert (await stale_results).json()["results"]["model_name"] == "Logistic Regression"
+            
+            monkeypatch.setattr(main, "evaluate_model", evaluate_model)
+            for _ in range(2):
+                response = await client.get("/results")
+                assert response.json()["results"]["model_name"] == "Decision Tree Classifier"
+    
+    asyncio.run(scenario())
+
+
+def test_upload_during_training_is_not_overwritten(monkeypatch):
+    class SlowDecisionTree(main.DecisionTreeClassifier):
+        def fit(self, X, y):
+            time.sleep(0.5)
+            return super().fit(X, y)
+    
+    monkeypatch.setattr(main, "DecisionTreeClassifier", SlowDecisionTree)
+    new_dataset = make_dataset().rename(columns={"x1": "a", "x2": "b", "label": "target"})
+    
+    async def scenario():
+        async with async_client() as client:
+            assert (await upload_csv(client, make_dataset())).status_code == 200
+            assert (await client.post("/split", json={"target_column": "label"})).status_code == 200
+            
+            training = asyncio.create_task(client.post("/train", json={"model_type": "decision_tree"}))
+            await asyncio.sleep(0.1)
+            assert (await upload_csv(client, new_dataset)).status_code == 200
+            assert (await training).status_code == 409
+            
+            dataset = (await client.get("/dataset")).json()
+            assert dataset["dataset_info"]["column_names"] == ["a", "b", "target"]
+            status = (await client.get("/pipeline-status")).json()
+            assert not status["split"] and not status["train"]
+    
+    asyncio.run(scenario())
+
+
+def test_split_frames_are_private_and_swept_with_their_session(client):
+    assert upload_csv(client, make_dataset()).status_code == 200
+    assert client.post("/split", json={"target_column": "label"}).status_code == 200
+    
+    session_id = client.headers["X-Session-ID"]
+    paths = [main.split_frame_path(session_id, name) for name in ("X_train", "X_test")]
+    for path in paths:
+        assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0
+    
+    async def scenario():
+        # Still in use: kept
+        await main.sweep_split_frames()
+        assert all(os.path.exists(path) for path in paths)
+        
+        # Session gone (expired or evicted): removed
+        await main.session_store.delete(session_id)
+        await main.sweep_split_frames()
+        assert not any(os.path.exists(path) for path in paths)
+    
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("method, scaler", [("standardize", StandardScaler), ("normalize", MinMaxScaler)])
+def test_preprocess_matches_sklearn_scalers(client, method, scaler):
+    df = make_dataset(rows=50)
+    df.loc[[3, 17], "x1"] = np.nan
+    df["constant"] = 7.5
+    assert upload_csv(client, df).status_code == 200
+    
+    columns = ["x1", "x2", "constant"]
+    response = client.post("/preprocess", json={"columns": columns, "method": method})
+    assert response.status_code == 200, response.text
+    
+    expected = scaler().fit_transform(df[columns])
+    for j, column in enumerate(columns):
+        np.testing.assert_allclose(preview_column(response, column), expected[:, j], rtol=1e-5, atol=1e-6)
+
+
+def test_scaler_cache_hits_and_misses(client):
+    assert upload_csv(client, make_dataset()).status_code == 200
+    request = {"columns": ["x1", "x2"], "method": "standardize"}
+    
+    assert client.post("/preprocess", json=request).json()["cached_applied"] is False
+    assert client.post("/reset-preprocessing").status_code == 200
+    assert client.post("/preprocess", json=request).json()["cached_applied"] is True
+    
+    # The columns were just standardized, so their content (and cache key) changed
+    assert client.post("/preprocess", json=request).json()["cached_applied"] is False
+
+
+def test_scaler_cache_is_bounded():
+    columns = [f"c{i}" for i in range(main.SCALER_CACHE_SIZE + 10)]
+    df = pd.DataFrame(np.random.default_rng(2).normal(size=(20, len(columns))), columns=columns)
+    cache = OrderedDict()
+    
+    for method in main.SCALING_METHODS:
+        arr = df.to_numpy(dtype=np.float32)
+        offset, scale, all_cached = main.cached_scaler_params(df, columns, arr, method, cache)
+        assert not all_cached
+        assert offset.shape == scale.shape == (len(columns),)
+        assert len(cache) == main.SCALER_CACHE_SIZE
+
+
+def test_upload_keeps_float_precision(client):
+    df = pd.DataFrame({
+        "price": [0.1, 12345.67, 3.3],
+        "ratio": [0.1, 2.5, None],
+        "name": ["a", "b", "c"],
+        "count": [1, 2, 3],
+    })
+    response = upload_csv(client, df)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    
+    # 12345.67 has 7 significant digits, more than float32 keeps
+    assert body["dataset_info"]["dtypes"] == {"price": "float64", "ratio": "float32", "name": "object", "count": "int8"}
+    assert body["warnings"] == ["Column 'price' kept as float64: its values lose precision in float32"]
+    # float32 cells print as written in mixed-dtype previews
+    assert '"data":[[0.1,0.1,"a",1],[12345.67,2.5,"b",2],[3.3,null,"c",3]]' in response.text
+
+
+def test_replay_matches_sequential_preprocessing(client):
+    df = make_dataset()
+    df.loc[5, "x2"] = np.nan
+    df["constant"] = 7.5
+    assert upload_csv(client, df).status_code == 200
+    
+    transformations = [
+        {"columns": ["x1", "x2", "constant"], "method": "standardize"},
+        {"columns": ["x1", "constant"], "method": "normalize"},
+        {"columns": ["x2"], "method": "normalize"},
+        {"columns": ["x2"], "method": "standardize"},
+    ]
+    for transformation in transformations:
+        sequential = client.post("/preprocess", json=transformation)
+        assert sequential.status_code == 200, sequential.text
+    
+    assert client.post("/reset-preprocessing").status_code == 200
+    replayed = client.post("/replay-preprocessing", json={"transformations": transformations})
+    assert replayed.status_code == 200, replayed.text
+    assert replayed.json()["transformations_applied"] == transformations
+    
+    for column in ("x1", "x2", "constant", "label"):
+        np.testing.assert_allclose(
+            preview_column(replayed, column), preview_column(sequential, column), rtol=1e-5, atol=1e-6
+        )
+    
+    response = client.post("/replay-preprocessing", json={
+        "transformations": [{"columns": ["x1"], "method": "robust"}],
+    })
+    assert response.status_code == 400
+    assert "robust" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("labels", [
+    np.r_[np.tile([0, 1], 30), 2],       # class 2 has a single sample
+    np.repeat(np.arange(60), 2),         # more classes than MAX_STRATIFY_CLASSES
+], ids=["single-member-class", "many-classes"])
+def test_split_falls_back_to_unstratified(client, labels):
+    df = make_dataset(rows=len(labels)).assign(label=labels)
+    assert upload_csv(client, df).status_code == 200
+    
+    response = client.post("/split", json={"target_column": "label", "test_size": 0.2})
+    assert response.status_code == 200, response.text
+    assert response.json()["split_info"]["stratified"] is False
+
+
+def test_split_stratifies_balanced_target(client):
+    assert upload_csv(client, make_dataset()).status_code == 200
+    response = client.post("/split", json={"target_column": "label", "test_size": 0.2})
+    assert response.json()["split_info"]["stratified"] is True
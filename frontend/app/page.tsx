@@ -9,7 +9,7 @@ import PreprocessStep from "@/components/steps/PreprocessStep";
 import SplitStep from "@/components/steps/SplitStep";
 import TrainStep from "@/components/steps/TrainStep";
 import ResultsStep from "@/components/steps/ResultsStep";
-import { DatasetInfo, DataPreview, SplitInfo, TrainResponse, resetPipeline } from "@/lib/api";
+import { DatasetInfo, DataPreview, SplitInfo, TrainResponse, Transformation, resetPipeline } from "@/lib/api";
 
 export default function Home() {
   // Pipeline state
@@ -19,7 +19,7 @@ export default function Home() {
   // Data state
   const [datasetInfo, setDatasetInfo] = useState<DatasetInfo | null>(null);
   const [preview, setPreview] = useState<DataPreview | null>(null);
-  const [transformations, setTransformations] = useState<string[]>([]);
+  const [transformations, setTransformations] = useState<Transformation[]>([]);
   const [splitInfo, setSplitInfo] = useState<SplitInfo | null>(null);
   const [trainInfo, setTrainInfo] = useState<TrainResponse["model_info"] | null>(null);
 
@@ -31,7 +31,7 @@ export default function Home() {
     setCurrentStep(1);
   };
 
-  const handlePreviewUpdate = (previewData: DataPreview, appliedTransformations: string[]) => {
+  const handlePreviewUpdate = (previewData: DataPreview, appliedTransformations: Transformation[]) => {
     setPreview(previewData);
     setTransformations(appliedTransformations);
   };
@@ -0,0 +1,57 @@
+"use client";
+
+import React from "react";
+import { ConfusionMatrixData } from "@/lib/api";
+
+interface ConfusionMatrixProps {
+  data: ConfusionMatrixData;
+}
+
+export default function ConfusionMatrix({ data }: ConfusionMatrixProps) {
+  const maxValue = Math.max(1, ...data.matrix.flat());
+
+  return (
+    <div className="inline-block">
+      <p className="text-xs text-gray-500 text-center mb-2 ml-16">Predicted Label</p>
+      <div className="flex items-center">
+        <p className="text-xs text-gray-500 -rotate-90 w-8 whitespace-nowrap">True Label</p>
+        <table className="text-sm border-collapse">
+          <thead>
+            <tr>
+              <th />
+              {data.labels.map((label, idx) => (
+                <th key={idx} className="px-3 py-2 font-medium text-gray-600">
+                  {String(label)}
+                </th>
+              ))}
+            </tr>
+          </thead>
+          <tbody>
+            {data.matrix.map((row, rowIdx) => (
+              <tr key={rowIdx}>
+                <th className="px-3 py-2 font-medium text-gray-600 text-right">
+                  {String(data.labels[rowIdx])}
+                </th>
+                {row.map((value, colIdx) => {
+                  const intensity = value / maxValue;
+                  return (
+                    <td
+                      key={colIdx}
+                      className="w-16 h-16 text-center font-semibold border border-white"
+                      style={{
+                        backgroundColor: `rgba(37, 99, 235, ${0.08 + intensity * 0.92})`,
+                        color: intensity > 0.5 ? "white" : "#1f2937",
+                      }}
+                    >
+                      {value}
+                    </td>
+                  );
+                })}
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+    </div>
+  );
+}
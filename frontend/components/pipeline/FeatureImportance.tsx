@@ -0,0 +1,32 @@
+"use client";
+
+import React from "react";
+
+interface FeatureImportanceProps {
+  features: string[];
+  importance: number[];
+}
+
+export default function FeatureImportance({ features, importance }: FeatureImportanceProps) {
+  const maxValue = Math.max(...importance, Number.EPSILON);
+
+  return (
+    <div className="w-full space-y-2">
+      {features.map((feature, idx) => (
+        <div key={feature} className="flex items-center gap-3 text-sm">
+          <span className="w-40 truncate text-right text-gray-600" title={feature}>
+            {feature}
+          </span>
+          <div className="flex-1 bg-gray-100 rounded h-5">
+            <div
+              className="bg-blue-500 h-5 rounded"
+              style={{ width: `${(importance[idx] / maxValue) * 100}%` }}
+            />
+          </div>
+          <span className="w-16 font-mono text-xs text-gray-500">{importance[idx].toFixed(3)}</span>
+        </div>
+      ))}
+      <p className="text-xs text-gray-400 text-center pt-2">Absolute Coefficient Value</p>
+    </div>
+  );
+}
@@ -1,19 +1,26 @@
 "use client";
 
 import React, { useState } from "react";
-import { Settings, Loader2, CheckCircle2, RotateCcw, Sparkles } from "lucide-react";
+import { Settings, Loader2, CheckCircle2, RotateCcw, Sparkles, X } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from "@/components/ui/card";
 import { Checkbox } from "@/components/ui/checkbox";
 import DataTable from "@/components/pipeline/DataTable";
-import { preprocessData, resetPreprocessing, DataPreview, DatasetInfo } from "@/lib/api";
+import {
+  preprocessData,
+  replayPreprocessing,
+  resetPreprocessing,
+  DataPreview,
+  DatasetInfo,
+  Transformation,
+} from "@/lib/api";
 import { cn } from "@/lib/utils";
 
 interface PreprocessStepProps {
   datasetInfo: DatasetInfo | null;
   preview: DataPreview | null;
-  transformations: string[];
-  onPreviewUpdate: (preview: DataPreview, transformations: string[]) => void;
+  transformations: Transformation[];
+  onPreviewUpdate: (preview: DataPreview, transformations: Transformation[]) => void;
   onComplete: () => void;
 }
 
@@ -78,6 +85,22 @@ export default function PreprocessStep({
     }
   };
 
+  // Drop one transformation and re-apply the rest to the original data in a single request
+  const handleRemoveTransformation = async (index: number) => {
+    setError(null);
+    setIsLoading(true);
+    try {
+      const response = await replayPreprocessing(transformations.filter((_, idx) => idx !== index));
+      if (response.success) {
+        onPreviewUpdate(response.preview, response.transformations_applied);
+      }
+    } catch (err: any) {
+      setError(err.response?.data?.detail || "Failed to update transformations");
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
   const handleReset = async () => {
     setIsLoading(true);
     try {
@@ -245,7 +268,19 @@ export default function PreprocessStep({
               {transformations.map((t, idx) => (
                 <li key={idx} className="flex items-center gap-2 text-sm text-gray-600">
                   <CheckCircle2 className="w-4 h-4 text-green-500" />
-                  {t}
+                  <span className="flex-1">
+                    {t.method === "standardize" ? "StandardScaler (z-score)" : "MinMaxScaler (0-1)"} on{" "}
+                    {t.columns.join(", ")}
+                  </span>
+                  <Button
+                    variant="ghost"
+                    size="sm"
+                    onClick={() => handleRemoveTransformation(idx)}
+                    disabled={isLoading}
+                    aria-label="Remove transformation"
+                  >
+                    <X className="w-4 h-4" />
+                  </Button>
                 </li>
               ))}
             </ul>
@@ -4,6 +4,8 @@ import React, { useState, useEffect } from "react";
 import { BarChart3, Loader2, CheckCircle2, Target, TrendingUp, RefreshCw } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from "@/components/ui/card";
+import ConfusionMatrix from "@/components/pipeline/ConfusionMatrix";
+import FeatureImportance from "@/components/pipeline/FeatureImportance";
 import { getResults, ResultsResponse, TrainResponse } from "@/lib/api";
 import { cn } from "@/lib/utils";
 
@@ -156,12 +158,8 @@ export default function ResultsStep({ trainInfo }: ResultsStepProps) {
           </CardDescription>
         </CardHeader>
         <CardContent>
-          <div className="flex justify-center">
-            <img
-              src={`data:image/png;base64,${results.visualizations.confusion_matrix.image}`}
-              alt="Confusion Matrix"
-              className="max-w-full h-auto rounded-lg shadow-sm"
-            />
+          <div className="flex justify-center overflow-x-auto">
+            <ConfusionMatrix data={results.visualizations.confusion_matrix} />
           </div>
         </CardContent>
       </Card>
@@ -180,13 +178,16 @@ export default function ResultsStep({ trainInfo }: ResultsStepProps) {
             </CardDescription>
           </CardHeader>
           <CardContent>
-            <div className="flex justify-center overflow-x-auto">
-              <img
-                src={`data:image/png;base64,${results.visualizations.model_specific.image}`}
-                alt={results.visualizations.model_specific.title}
-                className="max-w-full h-auto rounded-lg shadow-sm"
+            {results.visualizations.model_specific.type === "decision_tree" ? (
+              <pre className="max-h-[32rem] overflow-auto rounded-lg bg-gray-50 p-4 text-xs font-mono text-gray-700">
+                {results.visualizations.model_specific.text}
+              </pre>
+            ) : (
+              <FeatureImportance
+                features={results.visualizations.model_specific.features}
+                importance={results.visualizations.model_specific.importance}
               />
-            </div>
+            )}
           </CardContent>
         </Card>
       )}
@@ -2,10 +2,17 @@ import axios from 'axios';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
+// Identifies this page load's pipeline session on the backend (a reload starts a new session)
+const SESSION_ID =
+  typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function'
+    ? crypto.randomUUID()
+    : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+
 const api = axios.create({
   baseURL: API_BASE_URL,
   headers: {
     'Content-Type': 'application/json',
+    'X-Session-ID': SESSION_ID,
   },
 });
 
@@ -31,13 +38,20 @@ export interface UploadResponse {
   message: string;
   dataset_info: DatasetInfo;
   preview: DataPreview;
+  warnings: string[];
+}
+
+export interface Transformation {
+  method: 'standardize' | 'normalize';
+  columns: string[];
 }
 
 export interface PreprocessResponse {
   success: boolean;
   message: string;
   preview: DataPreview;
-  transformations_applied: string[];
+  transformations_applied: Transformation[];
+  cached_applied: boolean;
 }
 
 export interface SplitInfo {
@@ -49,6 +63,7 @@ export interface SplitInfo {
   feature_columns: string[];
   num_features: number;
   target_classes: any[];
+  stratified: boolean;
 }
 
 export interface SplitResponse {
@@ -65,9 +80,30 @@ export interface TrainResponse {
     model_name: string;
     training_samples: number;
     features_used: string[];
+    solver: string | null;
   };
 }
 
+export interface ConfusionMatrixData {
+  title: string;
+  matrix: number[][];
+  labels: (string | number)[];
+}
+
+export type ModelVisualization =
+  | {
+      title: string;
+      type: 'decision_tree';
+      dot: string;
+      text: string;
+    }
+  | {
+      title: string;
+      type: 'feature_importance';
+      features: string[];
+      importance: number[];
+    };
+
 export interface ResultsResponse {
   success: boolean;
   message: string;
@@ -79,14 +115,8 @@ export interface ResultsResponse {
     confusion_matrix: number[][];
   };
   visualizations: {
-    confusion_matrix: {
-      title: string;
-      image: string;
-    };
-    model_specific: {
-      title: string;
-      image: string;
-    } | null;
+    confusion_matrix: ConfusionMatrixData;
+    model_specific: ModelVisualization | null;
   };
 }
 
@@ -98,7 +128,7 @@ export interface PipelineStatus {
   results: boolean;
   details: {
     dataset_rows: number;
-    transformations: string[];
+    transformations: Transformation[];
     model_name: string | null;
     target_column: string | null;
   };
@@ -132,6 +162,11 @@ export const resetPreprocessing = async () => {
   return response.data;
 };
 
+export const replayPreprocessing = async (transformations: Transformation[]): Promise<PreprocessResponse> => {
+  const response = await api.post('/replay-preprocessing', { transformations });
+  return response.data;
+};
+
 export const splitData = async (
   target_column: string,
   test_size: number,